@@ -12,18 +12,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
-import io
+import atexit
+import functools
+import itertools
 import json
 import os
-import six
 import logging
+import math
+import re
 import inspect
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from weakref import WeakValueDictionary
 
+import numpy as np
 import paddle
 from paddle.nn import Layer
+try:
+    import orjson
+except ImportError:
+    orjson = None
 # TODO(fangzeyang) Temporary fix and replace by paddle framework downloader later
-from paddlenlp.utils.downloader import get_path_from_url
+from paddlenlp.utils.downloader import get_path_from_url, is_url, _map_path
 from paddlenlp.utils.env import MODEL_HOME
 from paddlenlp.utils.log import logger
 
@@ -35,6 +46,304 @@ __all__ = [
     'register_base_model',
 ]
 
+# Background writer and pending results for `save_pretrained(async_save=True)`,
+# use a single worker to keep the writing order of asynchronous saves, and
+# synchronous saves wait for pending ones before writing.
+_save_executor = ThreadPoolExecutor(max_workers=1)
+_pending_saves = []
+
+# Models loaded by `from_pretrained(use_model_cache=True)`, entries would be
+# dropped once the models are no longer referenced elsewhere.
+_model_cache = WeakValueDictionary()
+
+
+def _resolve_resource(name, file_id, file_path, default_root, md5sum=None):
+    """
+    Resolve the local path of resource `file_id` of pretrained model `name`,
+    downloading it into `default_root` if not cached. Results are memoized in
+    process, thus loading the same model repeatedly would not stat or download
+    files again, unless the memoized file has been removed. If `md5sum` is
+    provided, the cached file is checked against it on every call and
+    downloaded again on mismatch, thus it is not memoized.
+    Args:
+        name (str): name of or path to the pretrained model.
+        file_id (str): the resource name such as `model_state`.
+        file_path (str): URL or local file path of the resource.
+        default_root (str): directory to save downloaded files into.
+        md5sum (str, optional): md5 sum of the resource file. Default None.
+    Returns:
+        str: the local path of the resource.
+    """
+    if md5sum is not None:
+        return _resolve_uncached(file_path, default_root, md5sum)
+    resolved = _resolve_cached(name, file_id, file_path, default_root)
+    if resolved is not None and not os.path.exists(resolved):
+        # The cached file was removed such as by clearing `MODEL_HOME`
+        _resolve_cached.cache_clear()
+        resolved = _resolve_cached(name, file_id, file_path, default_root)
+    return resolved
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_cached(name, file_id, file_path, default_root):
+    # `name` and `file_id` are only used as part of the memo key
+    return _resolve_uncached(file_path, default_root)
+
+
+def _resolve_uncached(file_path, default_root, md5sum=None):
+    if file_path is None or os.path.isfile(file_path):
+        return file_path
+    # use the same file name as the downloader saves to
+    path = _map_path(file_path, default_root)
+    if os.path.exists(path):
+        if md5sum is None:
+            logger.info("Already cached %s", path)
+            return path
+    else:
+        logger.info("Downloading %s and saved to %s", file_path,
+                    default_root)
+    return get_path_from_url(file_path, default_root, md5sum)
+
+
+def _all_finite(value):
+    """
+    Whether all floats in JSON compatible `value` are finite.
+    """
+    if isinstance(value, float):
+        return math.isfinite(value)
+    if isinstance(value, (list, tuple)):
+        return all(_all_finite(v) for v in value)
+    if isinstance(value, dict):
+        return all(_all_finite(v) for v in value.values())
+    return True
+
+
+def _dump_config(model_config):
+    """
+    Serialize `model_config` into JSON bytes.
+    """
+    if orjson:
+        try:
+            # orjson always outputs UTF-8 as `ensure_ascii=False` does, and
+            # serializes tuples as lists as `json` does.
+            raw = orjson.dumps(model_config, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # orjson rejects values `json` accepts, such as integers beyond
+            # 64 bits, fall back to `json` for them.
+            pass
+        else:
+            # orjson writes NaN and Infinity as null silently, thus use `json`
+            # which writes them as `NaN` and `Infinity` for such configs. Only
+            # check when null is written, which is rare in configs.
+            if b"null" not in raw or _all_finite(model_config):
+                return raw
+    return json.dumps(model_config, ensure_ascii=False).encode("utf-8")
+
+
+_LONG_DIGITS = re.compile(rb"\d{20}")
+
+
+def _load_config(raw):
+    """
+    Deserialize JSON bytes `raw` written by `_dump_config` or `json`.
+    """
+    # orjson parses integers beyond 64 bits as floats losing precision, thus
+    # use `json` if there might be such integers (20 or more digits).
+    if orjson and not _LONG_DIGITS.search(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects `NaN` and `Infinity` which `json` writes and
+            # accepts, fall back to `json` for them.
+            pass
+    return json.loads(raw)
+
+
+def _write_bytes(raw, file_name):
+    with open(file_name, "wb") as f:
+        f.write(raw)
+
+
+def _make_tmp_file(file_name):
+    """
+    Create a unique temporary file in the directory of `file_name`, thus
+    concurrent writers of the same file in threads or processes would not
+    clobber each other.
+    """
+    while True:
+        tmp_file = "{}.{}.tmp".format(file_name, uuid.uuid4().hex)
+        try:
+            # Unlike `tempfile.mkstemp` which always uses mode 0600, create
+            # with 0666 masked by umask as `open` does, since the file would
+            # be renamed to `file_name` keeping its mode.
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+                         0o666)
+        except FileExistsError:
+            continue
+        os.close(fd)
+        return tmp_file
+
+
+def _save_files(writers):
+    """
+    Save files atomically, by writing all of them to temporary files first
+    and then renaming them, thus a crash in the middle would not leave torn
+    files or a new file next to an old one. The directories containing the
+    files are synced once at the end to persist the renaming.
+    Args:
+        writers (dict): mapping from file name to a callable which writes
+            the file content to the path given as the only argument. Files
+            are renamed in the order of `writers`.
+    """
+    tmp_files = {}
+    try:
+        for file_name, write in writers.items():
+            tmp_files[file_name] = _make_tmp_file(file_name)
+            write(tmp_files[file_name])
+            # Flush file data before renaming, otherwise an empty file might
+            # be left at `file_name` after power loss on some filesystems.
+            with open(tmp_files[file_name], "rb+") as f:
+                os.fsync(f.fileno())
+        for file_name, tmp_file in tmp_files.items():
+            os.replace(tmp_file, file_name)
+    except BaseException:
+        for tmp_file in tmp_files.values():
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+        raise
+    for save_dir in set(
+            os.path.dirname(os.path.abspath(file_name))
+            for file_name in writers):
+        try:
+            fd = os.open(save_dir, os.O_RDONLY)
+        except OSError:
+            # opening directories is not supported on some platforms like
+            # Windows
+            continue
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def _log_save_error(weight_file, future):
+    # done callback of asynchronous saving to not lose errors silently
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Failed to save model to %s: %s", weight_file,
+                     future.exception())
+
+
+@atexit.register
+def _wait_for_pending_saves():
+    # make sure asynchronous saving finishes before the process exits
+    wait(list(_pending_saves))
+
+
+# `str.removeprefix` is available since Python 3.9
+_remove_prefix = getattr(
+    str, "removeprefix",
+    lambda s, prefix: s[len(prefix):] if s.startswith(prefix) else s)
+
+
+# key of the size and modification time of source weight file in `.npz` cache
+_NPZ_SOURCE_KEY = "__source_stat__"
+
+
+def _load_state_dict(weight_path, use_cache=False):
+    """
+    Load weights from `weight_path` as numpy arrays, which could be set into
+    parameters directly rather than creating intermediate tensors for them.
+    If `use_cache` is True, the weights are also saved as an uncompressed
+    `.npz` file next to `weight_path` and loaded from it next time as long as
+    the size and modification time of `weight_path` recorded in it are not
+    changed. Reading raw arrays from it is faster than deserializing the
+    `.pdparams` file.
+    """
+    cache_path = weight_path + ".npz"
+    if use_cache:
+        weight_stat = os.stat(weight_path)
+        source_stat = np.array(
+            [weight_stat.st_size, weight_stat.st_mtime_ns], dtype="int64")
+        if os.path.exists(cache_path):
+            with np.load(cache_path) as f:
+                if _NPZ_SOURCE_KEY in f.files and np.array_equal(
+                        f[_NPZ_SOURCE_KEY], source_stat):
+                    return {k: f[k] for k in f.files if k != _NPZ_SOURCE_KEY}
+    state_dict = paddle.load(weight_path, return_numpy=True)
+    if use_cache:
+        tmp_file = None
+        try:
+            tmp_file = _make_tmp_file(cache_path)
+            # use file object since `np.savez` would append `.npz` to names
+            with open(tmp_file, "wb") as f:
+                np.savez(f, **{_NPZ_SOURCE_KEY: source_stat}, **state_dict)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, cache_path)
+        except OSError as e:
+            if tmp_file and os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            logger.warning("Failed to cache weights to %s: %s", cache_path,
+                           e)
+    return state_dict
+
+
+def _fast_clone(obj):
+    """
+    Deep copy of JSON compatible `obj` such as `pretrained_init_configuration`
+    by a JSON round trip, which is much faster than `copy.deepcopy`. Note that
+    tuples would be turned into lists as loading from config files does.
+    """
+    return _load_config(_dump_config(obj))
+
+
+@functools.lru_cache(maxsize=None)
+def _init_params(cls):
+    """
+    Get the parameters of `cls.__init__`, cached since `inspect.signature`
+    is expensive and would be called for every `from_pretrained`.
+    """
+    return inspect.signature(cls.__init__).parameters
+
+
+def _find_base_arg(init_args, init_kwargs, base_class_name):
+    """
+    Find the config of base model in the config of derived model, which is the
+    first dict including `init_class` in `init_args` and then `init_kwargs`.
+    `init_class` would be popped from the found config, and ValueError is
+    raised if it is not `base_class_name`.
+    Args:
+        init_args (list): position arguments of the derived model config.
+        init_kwargs (dict): keyword arguments of the derived model config.
+        base_class_name (str): the expected class name of the base model.
+    Returns:
+        tuple: the index in `init_args` or the name in `init_kwargs`, and the
+            config of base model. It would be `(None, None)` if not found.
+    """
+    for index, arg in itertools.chain(
+            enumerate(init_args), init_kwargs.items()):
+        if isinstance(arg, dict) and "init_class" in arg:
+            init_class = arg.pop("init_class")
+            if init_class != base_class_name:
+                raise ValueError("pretrained base model should be {}, but "
+                                 "got {}".format(base_class_name, init_class))
+            return index, arg
+    return None, None
+
+
+def _serialize(value):
+    """
+    Convert `value` in `init_config` into JSON compatible data recursively,
+    and `PretrainedModel` instances in it are replaced by their `init_config`.
+    """
+    if isinstance(value, PretrainedModel):
+        return _serialize(value.init_config)
+    if isinstance(value, (list, tuple)):
+        return [_serialize(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _serialize(v) for k, v in value.items()}
+    return value
+
 
 def register_base_model(cls):
     """
@@ -51,8 +360,7 @@ def register_base_model(cls):
     return cls
 
 
-@six.add_metaclass(InitTrackerMeta)
-class PretrainedModel(Layer, GenerationMixin):
+class PretrainedModel(Layer, GenerationMixin, metaclass=InitTrackerMeta):
     """
     The base class for all pretrained models. It provides some attributes and
     common methods for all pretrained models, including attributes `init_config`,
@@ -64,7 +372,8 @@ class PretrainedModel(Layer, GenerationMixin):
       names for saving and loading.
     - `pretrained_resource_files_map` (dict): The dict has the same keys as
       `resource_files_names`, the values are also dict mapping specific pretrained
-      model name to URL linking to pretrained model.
+      model name to URL linking to pretrained model. The URL could also be given
+      as a tuple `(url, md5sum)` to check the integrity of cached files.
     - `pretrained_init_configuration` (dict): The dict has pretrained model names
       as keys, and the values are also dict preserving corresponding configuration
       for model initialization.
@@ -122,18 +431,46 @@ class PretrainedModel(Layer, GenerationMixin):
                 this to update pre-defined keyword argument values for model
                 initialization. If the key is in base model `__init__`, update
                 keyword argument of base model; else update keyword argument of
-                derived model.
+                derived model. Besides, `use_model_cache` (bool) could be
+                provided to reuse the model instance previously loaded in
+                process with the same arguments if it is still alive, which
+                makes repeated loading nearly free. Note that the returned
+                model is shared in that case, thus modifications on it would
+                be visible to all callers. It only works in dynamic graph mode
+                and defaults to False. And `use_weight_cache` (bool) could be
+                provided to keep a copy of weights as uncompressed `.npz` file
+                next to the `.pdparams` file, which could be loaded faster by
+                later calls even across processes. Defaults to False.
         Returns:
             PretrainedModel: An instance of PretrainedModel.
         """
-        pretrained_models = list(cls.pretrained_init_configuration.keys())
+        use_model_cache = kwargs.pop("use_model_cache", False)
+        use_weight_cache = kwargs.pop("use_weight_cache", False)
+        cache_key = None
+        if use_model_cache and paddle.in_dynamic_mode():
+            cache_key = (cls, pretrained_model_name_or_path, args,
+                         tuple(sorted(kwargs.items())))
+            try:
+                model = _model_cache.get(cache_key)
+            except TypeError:
+                # unhashable arguments could not be cached
+                cache_key = None
+            else:
+                if model is not None:
+                    return model
+        # use dict rather than list of keys for constant-time membership test
+        pretrained_models = cls.pretrained_init_configuration
         resource_files = {}
+        resource_md5sums = {}
         init_configuration = {}
         if pretrained_model_name_or_path in pretrained_models:
             for file_id, map_list in cls.pretrained_resource_files_map.items():
-                resource_files[file_id] = map_list[
-                    pretrained_model_name_or_path]
-            init_configuration = copy.deepcopy(
+                resource = map_list[pretrained_model_name_or_path]
+                if isinstance(resource, (list, tuple)):
+                    # resource is given as (url, md5sum)
+                    resource, resource_md5sums[file_id] = resource
+                resource_files[file_id] = resource
+            init_configuration = _fast_clone(
                 cls.pretrained_init_configuration[
                     pretrained_model_name_or_path])
         else:
@@ -155,27 +492,55 @@ class PretrainedModel(Layer, GenerationMixin):
 
         default_root = os.path.join(MODEL_HOME, pretrained_model_name_or_path)
 
-        resolved_resource_files = {}
-        for file_id, file_path in resource_files.items():
-            path = os.path.join(default_root, file_path.split('/')[-1])
-            if file_path is None or os.path.isfile(file_path):
-                resolved_resource_files[file_id] = file_path
-            elif os.path.exists(path):
-                logger.info("Already cached %s" % path)
-                resolved_resource_files[file_id] = path
-            else:
-                logger.info("Downloading %s and saved to %s" %
-                            (file_path, default_root))
-                resolved_resource_files[file_id] = get_path_from_url(
-                    file_path, default_root)
+        num_urls = sum(
+            is_url(file_path) for file_path in resource_files.values()
+            if file_path is not None)
+        if num_urls > 0:
+            # Create the cache directory before dispatching downloads, since
+            # concurrent downloaders would race on creating it.
+            os.makedirs(default_root, exist_ok=True)
+
+        def _resolve_one(file_id, file_path):
+            return file_id, _resolve_resource(
+                pretrained_model_name_or_path, file_id, file_path,
+                default_root, resource_md5sums.get(file_id))
+
+        if num_urls > 1:
+            # Resolve resources concurrently, downloading is mostly network
+            # bound and thus the total time is bounded by the slowest file.
+            resolved_resource_files = {}
+            with ThreadPoolExecutor(max_workers=min(8, len(
+                    resource_files))) as executor:
+                futures = [
+                    executor.submit(_resolve_one, file_id, file_path)
+                    for file_id, file_path in resource_files.items()
+                ]
+                for future in as_completed(futures):
+                    file_id, resolved = future.result()
+                    resolved_resource_files[file_id] = resolved
+            # Keep the order of `resource_files` since the weight file is
+            # taken as the first resolved resource.
+            resolved_resource_files = {
+                file_id: resolved_resource_files[file_id]
+                for file_id in resource_files
+            }
+        else:
+            # Resolve serially when there is at most one file to download,
+            # which avoids the overhead of creating threads.
+            resolved_resource_files = dict(
+                _resolve_one(file_id, file_path)
+                for file_id, file_path in resource_files.items())
 
         # Prepare model initialization kwargs
         # Did we saved some inputs and kwargs to reload ?
         model_config_file = resolved_resource_files.pop("model_config_file",
                                                         None)
         if model_config_file is not None:
-            with io.open(model_config_file, encoding="utf-8") as f:
-                init_kwargs = json.load(f)
+            # Read the whole file at once and parse from bytes, which is faster
+            # than parsing from the file object.
+            with open(model_config_file, "rb") as f:
+                raw = f.read()
+            init_kwargs = _load_config(raw)
         else:
             init_kwargs = init_configuration
         # position args are stored in kwargs, maybe better not include
@@ -194,26 +559,12 @@ class PretrainedModel(Layer, GenerationMixin):
         else:  # extract config for base model
             derived_args = list(init_args)
             derived_kwargs = init_kwargs
-            base_arg = None
-            for i, arg in enumerate(init_args):
-                if isinstance(arg, dict) and "init_class" in arg:
-                    assert arg.pop(
-                        "init_class") == cls.base_model_class.__name__, (
-                            "pretrained base model should be {}"
-                        ).format(cls.base_model_class.__name__)
-                    base_arg_index = i
-                    base_arg = arg
-                    break
-            for arg_name, arg in init_kwargs.items():
-                if isinstance(arg, dict) and "init_class" in arg:
-                    assert arg.pop(
-                        "init_class") == cls.base_model_class.__name__, (
-                            "pretrained base model should be {}"
-                        ).format(cls.base_model_class.__name__)
-                    base_arg_index = arg_name
-                    base_arg = arg
-                    break
-
+            base_arg_index, base_arg = _find_base_arg(
+                init_args, init_kwargs, cls.base_model_class.__name__)
+            if base_arg is None:
+                raise ValueError(
+                    "config of pretrained base model {} not found".format(
+                        cls.base_model_class.__name__))
             base_args = base_arg.pop("init_args", ())
             base_kwargs = base_arg
         if cls == cls.base_model_class:
@@ -223,62 +574,73 @@ class PretrainedModel(Layer, GenerationMixin):
             model = cls(*base_args, **base_kwargs)
         else:
             # Update with newly provided args and kwargs for derived model
-            base_parameters_dict = inspect.signature(
-                cls.base_model_class.__init__).parameters
+            base_parameters_dict = _init_params(cls.base_model_class)
+            derived_parameters_dict = _init_params(cls)
             for k, v in kwargs.items():
                 if k in base_parameters_dict:
                     base_kwargs[k] = v
+                if k in derived_parameters_dict:
+                    derived_kwargs[k] = v
             base_model = cls.base_model_class(*base_args, **base_kwargs)
-            if base_arg_index is not None:
+            if isinstance(base_arg_index, str):
+                derived_kwargs[base_arg_index] = base_model
+            elif base_arg_index is not None:
                 derived_args[base_arg_index] = base_model
             else:
-                derived_args = (base_model, )  # assume at the first position
+                # assume at the first position
+                derived_args = (base_model, )
             derived_args = derived_args if not args else args
-            derived_parameters_dict = inspect.signature(cls.__init__).parameters
-            for k, v in kwargs.items():
-                if k in derived_parameters_dict:
-                    derived_kwargs[k] = v
             model = cls(*derived_args, **derived_kwargs)
 
         # Maybe need more ways to load resources.
         weight_path = list(resolved_resource_files.values())[0]
         assert weight_path.endswith(
             ".pdparams"), "suffix of weight must be .pdparams"
-        state_dict = paddle.load(weight_path)
+        state_dict = _load_state_dict(weight_path, use_weight_cache)
 
         # Make sure we are able to load base models as well as derived models
         # (with heads)
-        start_prefix = ""
+        start_prefix = cls.base_model_prefix + "."
         model_to_load = model
         state_to_load = state_dict
         unexpected_keys = []
         missing_keys = []
-        if not hasattr(model, cls.base_model_prefix) and any(
-                s.startswith(cls.base_model_prefix) for s in state_dict.keys()):
-            # base model
-            state_to_load = {}
-            start_prefix = cls.base_model_prefix + "."
+        if not hasattr(model, cls.base_model_prefix):
+            # base model, strip the prefix of weights saved by derived models
+            # and find the unused ones in a single pass
+            stripped_state = {}
+            unused_keys = []
             for k, v in state_dict.items():
-                if k.startswith(cls.base_model_prefix):
-                    state_to_load[k[len(start_prefix):]] = v
+                if k.startswith(start_prefix):
+                    stripped_state[_remove_prefix(k, start_prefix)] = v
                 else:
-                    unexpected_keys.append(k)
-        if hasattr(model, cls.base_model_prefix) and not any(
-                s.startswith(cls.base_model_prefix) for s in state_dict.keys()):
+                    unused_keys.append(k)
+            if stripped_state:
+                state_to_load = stripped_state
+                unexpected_keys = unused_keys
+                # `state_dict()` walks all sublayers, only call it once
+                model_keys = model.state_dict().keys()
+                missing_keys = sorted(model_keys - stripped_state.keys())
+        elif not any(k.startswith(start_prefix) for k in state_dict):
             # derived model (base model with heads)
             model_to_load = getattr(model, cls.base_model_prefix)
-            for k in model.state_dict().keys():
-                if not k.startswith(cls.base_model_prefix):
-                    missing_keys.append(k)
-        if len(missing_keys) > 0:
-            logger.info(
-                "Weights of {} not initialized from pretrained model: {}".
-                format(model.__class__.__name__, missing_keys))
-        if len(unexpected_keys) > 0:
-            logger.info("Weights from pretrained model not used in {}: {}".
-                        format(model.__class__.__name__, unexpected_keys))
+            model_keys = model.state_dict().keys()
+            missing_keys = [
+                k for k in model_keys if not k.startswith(start_prefix)
+            ]
+        # Avoid formatting the possibly long key lists if not to be logged
+        if logger.isEnabledFor(logging.INFO):
+            if missing_keys:
+                logger.info(
+                    "Weights of %s not initialized from pretrained model: %s",
+                    model.__class__.__name__, missing_keys)
+            if unexpected_keys:
+                logger.info("Weights from pretrained model not used in %s: %s",
+                            model.__class__.__name__, unexpected_keys)
         model_to_load.set_state_dict(state_to_load)
         if paddle.in_dynamic_mode():
+            if cache_key is not None:
+                _model_cache[cache_key] = model
             return model
         return model, state_to_load
 
@@ -291,33 +653,68 @@ class PretrainedModel(Layer, GenerationMixin):
         """
         # Save model config
         model_config_file = os.path.join(save_dir, self.model_config_file)
-        model_config = self.init_config
-        # If init_config contains a Layer, use the layer's init_config to save
-        for key, value in model_config.items():
-            if key == "init_args":
-                args = []
-                for arg in value:
-                    args.append(
-                        arg.init_config
-                        if isinstance(arg, PretrainedModel) else arg)
-                model_config[key] = tuple(args)
-            elif isinstance(value, PretrainedModel):
-                model_config[key] = value.init_config
-        with io.open(model_config_file, "w", encoding="utf-8") as f:
-            f.write(json.dumps(model_config, ensure_ascii=False))
-
-    def save_pretrained(self, save_dir):
+        # If init_config contains a Layer, use the layer's init_config to save.
+        # Serialize to new containers to keep `self.init_config` unchanged.
+        raw = _dump_config(_serialize(self.init_config))
+        # wait for asynchronous saves which would overwrite it otherwise
+        wait(list(_pending_saves))
+        _save_files({model_config_file: functools.partial(_write_bytes, raw)})
+
+    def save_pretrained(self, save_dir, async_save=False):
         """
         Save model configuration and related resources (model state) to files
         under `save_dir`.
         Args:
             save_dir (str): Directory to save files into.
+            async_save (bool, optional): If True, take a snapshot of the model
+                configuration and state on host memory and write them to files
+                in a background thread, thus the caller is not blocked by the
+                disk writing and could go on updating parameters. Use
+                `wait_for_saves` to make sure files are completely written
+                before using them. Errors while writing are logged, and the
+                process waits for pending saves before exiting. Saves with
+                `async_save=False` wait for pending ones first. It only works
+                in dynamic graph mode. Default False.
         """
         assert os.path.isdir(
             save_dir), "save_dir ({}) is not available.".format(save_dir)
-        # Save model config 
-        self.save_model_config(save_dir)
-        # Save model
+        model_config_file = os.path.join(save_dir, self.model_config_file)
+        raw = _dump_config(_serialize(self.init_config))
         file_name = os.path.join(save_dir,
                                  list(self.resource_files_names.values())[0])
-        paddle.save(self.state_dict(), file_name)
+        if async_save and paddle.in_dynamic_mode():
+            state_dict = {k: v.numpy() for k, v in self.state_dict().items()}
+        else:
+            async_save = False
+            state_dict = self.state_dict()
+        # Save model state and config together, and rename config at last.
+        writers = OrderedDict([
+            (file_name, functools.partial(paddle.save, state_dict)),
+            (model_config_file, functools.partial(_write_bytes, raw)),
+        ])
+        if async_save:
+            # drop finished saves, and keep the failed ones to be raised by
+            # `wait_for_saves`
+            _pending_saves[:] = [
+                future for future in _pending_saves
+                if not future.done() or future.exception() is not None
+            ]
+            future = _save_executor.submit(_save_files, writers)
+            future.add_done_callback(
+                functools.partial(_log_save_error, file_name))
+            _pending_saves.append(future)
+        else:
+            # Wait for previous asynchronous saves, otherwise they might
+            # finish later and overwrite files of this save with older ones.
+            wait(list(_pending_saves))
+            _save_files(writers)
+
+    @staticmethod
+    def wait_for_saves():
+        """
+        Block until all models saved by `save_pretrained` with
+        `async_save=True` are written to files. Exceptions raised while writing
+        would be raised here.
+        """
+        while _pending_saves:
+            _pending_saves.pop(0).result()
@@ -16,6 +16,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import contextlib
 import os
 import sys
 import os.path as osp
@@ -27,6 +28,12 @@ import zipfile
 import time
 from collections import OrderedDict
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
 try:
     from tqdm import tqdm
 except:
@@ -139,6 +146,11 @@ def get_path_from_url(url, root_dir, md5sum=None, check_exist=True):
     if file or directory specified by url is exists under
     root_dir, return the path directly, otherwise download
     from url and decompress it, return the path.
+    Downloading and decompressing are guarded by an inter-process lock,
+    thus concurrent processes would not download the same file repeatedly.
+    Note that the lock file `<file name>.lock` is left in root_dir after
+    downloading, which is harmless and could be removed when no process is
+    downloading.
     Args:
         url (str): download url
         root_dir (str): root dir for downloading, it should be
@@ -155,22 +167,59 @@ def get_path_from_url(url, root_dir, md5sum=None, check_exist=True):
     # parse path after download to decompress under root_dir
     fullpath = _map_path(url, root_dir)
 
-    if osp.exists(fullpath) and check_exist and _md5check(fullpath, md5sum):
+    found = osp.exists(fullpath) and check_exist and _md5check(fullpath,
+                                                              md5sum)
+    if found:
         logger.info("Found {}".format(fullpath))
-    else:
-        if ParallelEnv().local_rank % 8 == 0:
-            fullpath = _download(url, root_dir, md5sum)
-        else:
-            while not os.path.exists(fullpath):
-                time.sleep(1)
-
     if ParallelEnv().local_rank % 8 == 0:
-        if tarfile.is_tarfile(fullpath) or zipfile.is_zipfile(fullpath):
-            fullpath = _decompress(fullpath)
+        if not found or _is_archive(fullpath):
+            os.makedirs(root_dir, exist_ok=True)
+            # Lock to make only one of the concurrent processes download and
+            # decompress, and the others would find the results after it
+            # finishes rather than reading partially extracted files.
+            with _download_lock(fullpath + ".lock"):
+                if not found:
+                    fullpath = _download(url, root_dir, md5sum)
+                if _is_archive(fullpath):
+                    fullpath = _decompress(fullpath)
+    elif not found:
+        while not os.path.exists(fullpath):
+            time.sleep(1)
 
     return fullpath
 
 
+def _is_archive(path):
+    return tarfile.is_tarfile(path) or zipfile.is_zipfile(path)
+
+
+@contextlib.contextmanager
+def _download_lock(lock_path):
+    """
+    Inter-process exclusive lock based on file `lock_path`.
+    """
+    with open(lock_path, "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # `LK_LOCK` gives up after retrying for 10 seconds
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
 def _download(url, path, md5sum=None):
     """
     Download from url, save to path.
@@ -104,11 +104,14 @@ class Logger(object):
     def is_enable(self) -> bool:
         return self._is_enable
 
-    def __call__(self, log_level: str, msg: str):
+    def isEnabledFor(self, log_level: int) -> bool:
+        return self.is_enable and self.logger.isEnabledFor(log_level)
+
+    def __call__(self, log_level: str, msg: str, *args):
         if not self.is_enable:
             return
 
-        self.logger.log(log_level, msg)
+        self.logger.log(log_level, msg, *args)
 
     @contextlib.contextmanager
     def use_terminator(self, terminator: str):
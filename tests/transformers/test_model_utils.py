@@ -0,0 +1,334 @@
+# Copyright (c) 2021 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import gc
+import json
+import math
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import paddle
+import paddle.nn as nn
+
+from paddlenlp.transformers import model_utils
+from paddlenlp.transformers.model_utils import PretrainedModel, register_base_model
+from common_test import CpuCommonTest
+
+TINY_URL = "https://example.com/tiny/model_state.pdparams"
+
+
+class TinyPretrainedModel(PretrainedModel):
+    base_model_prefix = "tiny"
+    pretrained_init_configuration = {"tiny-test": {"hidden_size": 4}}
+    pretrained_resource_files_map = {
+        "model_state": {
+            "tiny-test": (TINY_URL, "fake-md5sum")
+        }
+    }
+
+
+@register_base_model
+class TinyModel(TinyPretrainedModel):
+    def __init__(self, hidden_size=4):
+        super(TinyModel, self).__init__()
+        self.hidden_size = hidden_size
+        self.linear = nn.Linear(hidden_size, hidden_size)
+
+
+class TinyForClassification(TinyPretrainedModel):
+    def __init__(self, tiny, num_classes=2):
+        super(TinyForClassification, self).__init__()
+        self.tiny = tiny
+        self.classifier = nn.Linear(tiny.hidden_size, num_classes)
+
+
+class ModelUtilsTest(CpuCommonTest):
+    def setUp(self):
+        self.model_home = tempfile.mkdtemp()
+        self.save_dir = tempfile.mkdtemp()
+        patcher = mock.patch.object(model_utils, "MODEL_HOME",
+                                    self.model_home)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        model_utils._resolve_cached.cache_clear()
+
+    def tearDown(self):
+        model_utils.PretrainedModel.wait_for_saves()
+        shutil.rmtree(self.model_home)
+        shutil.rmtree(self.save_dir)
+
+    def fake_download(self, url, root_dir, md5sum=None):
+        path = os.path.join(root_dir, os.path.basename(url))
+        paddle.save(TinyModel(hidden_size=4).state_dict(), path)
+        return path
+
+
+class TestResolveResource(ModelUtilsTest):
+    def test_md5sum_of_resource_tuple(self):
+        with mock.patch.object(
+                model_utils, "get_path_from_url",
+                side_effect=self.fake_download) as download:
+            model = TinyModel.from_pretrained("tiny-test")
+            self.assertIsInstance(model, TinyModel)
+            download.assert_called_once_with(
+                TINY_URL,
+                os.path.join(self.model_home, "tiny-test"), "fake-md5sum")
+            # md5sum would be checked again by every load
+            TinyModel.from_pretrained("tiny-test")
+            self.assertEqual(download.call_count, 2)
+
+    def test_removed_cache_resolved_again(self):
+        with mock.patch.dict(TinyPretrainedModel.pretrained_resource_files_map,
+                             {"model_state": {
+                                 "tiny-test": TINY_URL
+                             }}), mock.patch.object(
+                                 model_utils,
+                                 "get_path_from_url",
+                                 side_effect=self.fake_download) as download:
+            TinyModel.from_pretrained("tiny-test")
+            TinyModel.from_pretrained("tiny-test")
+            self.assertEqual(download.call_count, 1)
+            shutil.rmtree(os.path.join(self.model_home, "tiny-test"))
+            os.makedirs(os.path.join(self.model_home, "tiny-test"))
+            TinyModel.from_pretrained("tiny-test")
+            self.assertEqual(download.call_count, 2)
+
+    def test_cached_file_of_url_with_query(self):
+        url = TINY_URL + "?download=1"
+        root_dir = os.path.join(self.model_home, "tiny-test")
+        os.makedirs(root_dir)
+        # downloaded by `get_path_from_url` previously
+        self.fake_download(url, root_dir)
+        with mock.patch.dict(TinyPretrainedModel.pretrained_resource_files_map,
+                             {"model_state": {
+                                 "tiny-test": url
+                             }}), mock.patch.object(
+                                 model_utils,
+                                 "get_path_from_url",
+                                 side_effect=self.fake_download) as download:
+            TinyModel.from_pretrained("tiny-test")
+            self.assertEqual(download.call_count, 0)
+
+    def test_resolve_serially_without_multiple_urls(self):
+        TinyModel(hidden_size=4).save_pretrained(self.save_dir)
+        with mock.patch.object(
+                model_utils,
+                "ThreadPoolExecutor",
+                side_effect=AssertionError("executor created")), \
+                mock.patch.object(
+                    model_utils,
+                    "get_path_from_url",
+                    side_effect=self.fake_download):
+            TinyModel.from_pretrained(self.save_dir)
+            TinyModel.from_pretrained("tiny-test")
+
+
+class TestSavePretrained(ModelUtilsTest):
+    def check_same_state(self, model, loaded_model):
+        loaded_state = loaded_model.state_dict()
+        for k, v in model.state_dict().items():
+            self.check_output_equal(loaded_state[k].numpy(), v.numpy())
+
+    @unittest.skipIf(os.name != "posix", "file modes are POSIX specific")
+    def test_saved_files_honour_umask(self):
+        umask = os.umask(0o022)
+        try:
+            TinyModel(hidden_size=4).save_pretrained(self.save_dir)
+        finally:
+            os.umask(umask)
+        for file_name in os.listdir(self.save_dir):
+            mode = os.stat(os.path.join(self.save_dir, file_name)).st_mode
+            self.assertEqual(mode & 0o777, 0o644)
+
+    def test_async_save_round_trip(self):
+        model = TinyForClassification(TinyModel(hidden_size=4), num_classes=3)
+        model.save_pretrained(self.save_dir, async_save=True)
+        TinyPretrainedModel.wait_for_saves()
+        self.assertEqual(
+            sorted(os.listdir(self.save_dir)),
+            ["model_config.json", "model_state.pdparams"])
+        loaded_model = TinyForClassification.from_pretrained(self.save_dir)
+        self.assertEqual(loaded_model.classifier.weight.shape, [4, 3])
+        self.check_same_state(model, loaded_model)
+
+    def test_sync_save_after_async_save(self):
+        old_model = TinyModel(hidden_size=4)
+        model = TinyModel(hidden_size=6)
+        # delay the asynchronous save to make it finish after the sync one
+        # if the latter does not wait for it
+        save_files = model_utils._save_files
+
+        def _slow_save_files(writers):
+            time.sleep(0.5)
+            save_files(writers)
+
+        with mock.patch.object(
+                model_utils, "_save_files", side_effect=_slow_save_files):
+            old_model.save_pretrained(self.save_dir, async_save=True)
+        model.save_pretrained(self.save_dir)
+        TinyPretrainedModel.wait_for_saves()
+        loaded_model = TinyModel.from_pretrained(self.save_dir)
+        self.assertEqual(loaded_model.hidden_size, 6)
+        self.check_same_state(model, loaded_model)
+
+    def test_async_save_snapshot(self):
+        model = TinyModel(hidden_size=4)
+        expected_state = {k: v.numpy() for k, v in model.state_dict().items()}
+        model.save_pretrained(self.save_dir, async_save=True)
+        # updating parameters after saving would not change saved files
+        model.linear.weight.set_value(
+            paddle.zeros_like(model.linear.weight))
+        TinyPretrainedModel.wait_for_saves()
+        loaded_state = TinyModel.from_pretrained(self.save_dir).state_dict()
+        for k, v in expected_state.items():
+            self.check_output_equal(loaded_state[k].numpy(), v)
+
+
+class TestWeightCache(ModelUtilsTest):
+    def test_cache_invalidated_by_replaced_weights(self):
+        TinyModel(hidden_size=4).save_pretrained(self.save_dir)
+        TinyModel.from_pretrained(self.save_dir, use_weight_cache=True)
+        weight_file = os.path.join(self.save_dir, "model_state.pdparams")
+        self.assertTrue(os.path.exists(weight_file + ".npz"))
+        with mock.patch.object(
+                model_utils.paddle, "load",
+                side_effect=AssertionError("cache not used")):
+            TinyModel.from_pretrained(self.save_dir, use_weight_cache=True)
+
+        # replace weights with the same size and an older mtime than cache
+        model = TinyModel(hidden_size=4)
+        model.save_pretrained(self.save_dir)
+        os.utime(weight_file, ns=(0, 0))
+        loaded_model = TinyModel.from_pretrained(
+            self.save_dir, use_weight_cache=True)
+        self.check_output_equal(loaded_model.linear.weight.numpy(),
+                                model.linear.weight.numpy())
+
+
+class TestModelCache(ModelUtilsTest):
+    def setUp(self):
+        super(TestModelCache, self).setUp()
+        model_utils._model_cache.clear()
+        TinyModel(hidden_size=4).save_pretrained(self.save_dir)
+
+    def test_cache_hit(self):
+        model = TinyForClassification.from_pretrained(
+            self.save_dir, num_classes=3, use_model_cache=True)
+        with mock.patch.object(
+                model_utils, "_load_state_dict",
+                side_effect=AssertionError("cache not used")):
+            self.assertIs(
+                TinyForClassification.from_pretrained(
+                    self.save_dir, num_classes=3, use_model_cache=True),
+                model)
+
+    def test_cache_miss_of_different_kwargs(self):
+        model = TinyForClassification.from_pretrained(
+            self.save_dir, num_classes=3, use_model_cache=True)
+        other_model = TinyForClassification.from_pretrained(
+            self.save_dir, num_classes=2, use_model_cache=True)
+        self.assertIsNot(other_model, model)
+        self.assertEqual(other_model.classifier.weight.shape, [4, 2])
+        # not cached without `use_model_cache`
+        self.assertIsNot(
+            TinyForClassification.from_pretrained(
+                self.save_dir, num_classes=3), model)
+
+    def test_unhashable_kwargs_not_cached(self):
+        # kwargs unknown to the derived model are ignored when loading
+        model = TinyForClassification.from_pretrained(
+            self.save_dir, unused=[1], use_model_cache=True)
+        self.assertIsInstance(model, TinyForClassification)
+        self.assertEqual(len(model_utils._model_cache), 0)
+        self.assertIsNot(
+            TinyForClassification.from_pretrained(
+                self.save_dir, unused=[1], use_model_cache=True), model)
+
+    def test_entry_dropped_after_del(self):
+        model = TinyForClassification.from_pretrained(
+            self.save_dir, use_model_cache=True)
+        self.assertEqual(len(model_utils._model_cache), 1)
+        del model
+        gc.collect()
+        self.assertEqual(len(model_utils._model_cache), 0)
+
+
+class TestBaseModelConfig(ModelUtilsTest):
+    def test_base_model_config_in_kwargs(self):
+        model = TinyForClassification(
+            tiny=TinyModel(hidden_size=6), num_classes=3)
+        model.save_pretrained(self.save_dir)
+        with open(os.path.join(self.save_dir, "model_config.json")) as f:
+            config = json.load(f)
+        self.assertNotIn("init_args", config)
+        self.assertEqual(config["tiny"]["init_class"], "TinyModel")
+        loaded_model = TinyForClassification.from_pretrained(self.save_dir)
+        self.assertEqual(loaded_model.tiny.linear.weight.shape, [6, 6])
+        self.assertEqual(loaded_model.classifier.weight.shape, [6, 3])
+
+    def test_mismatched_base_model(self):
+        model = TinyForClassification(TinyModel(hidden_size=4))
+        model.save_pretrained(self.save_dir)
+        config_file = os.path.join(self.save_dir, "model_config.json")
+        with open(config_file) as f:
+            config = json.load(f)
+        config["init_args"][0]["init_class"] = "OtherModel"
+        with open(config_file, "w") as f:
+            json.dump(config, f)
+        with self.assertRaises(ValueError):
+            TinyForClassification.from_pretrained(self.save_dir)
+
+    def test_missing_base_model(self):
+        model = TinyForClassification(TinyModel(hidden_size=4))
+        model.save_pretrained(self.save_dir)
+        config_file = os.path.join(self.save_dir, "model_config.json")
+        with open(config_file) as f:
+            config = json.load(f)
+        del config["init_args"][0]["init_class"]
+        with open(config_file, "w") as f:
+            json.dump(config, f)
+        with self.assertRaises(ValueError):
+            TinyForClassification.from_pretrained(self.save_dir)
+
+
+class TestConfigSerialization(CpuCommonTest):
+    def test_non_finite_round_trip(self):
+        config = {"dropout": float("nan"), "scale": [1.0, float("-inf")]}
+        raw = model_utils._dump_config(config)
+        # keep compatible with `json` rather than writing null
+        self.assertEqual(json.loads(raw)["scale"], [1.0, float("-inf")])
+        loaded_config = model_utils._load_config(raw)
+        self.assertTrue(math.isnan(loaded_config["dropout"]))
+        self.assertEqual(loaded_config["scale"], [1.0, float("-inf")])
+
+    def test_big_int_round_trip(self):
+        config = {"seed": 2**70, "vocab_size": 30522, "pad_token_id": None}
+        self.assertEqual(
+            model_utils._load_config(model_utils._dump_config(config)),
+            config)
+        self.assertEqual(model_utils._fast_clone(config), config)
+
+    def test_load_json_written_config(self):
+        raw = json.dumps({"scale": float("inf"), "name": "模型"}).encode()
+        self.assertEqual(
+            model_utils._load_config(raw),
+            {"scale": float("inf"),
+             "name": "模型"})
+
+
+if __name__ == "__main__":
+    unittest.main()
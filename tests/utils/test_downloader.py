@@ -0,0 +1,100 @@
+# Copyright (c) 2021 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import io
+import multiprocessing
+import os
+import shutil
+import tarfile
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from paddlenlp.utils import downloader
+from common_test import CpuCommonTest
+
+ARCHIVE_URL = "https://example.com/data/vocab.tar.gz"
+
+
+def _make_archive():
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        for name in ["vocab/vocab.txt", "vocab/merges.txt"]:
+            content = os.urandom(32 * 1024)
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+    return buf.getvalue()
+
+
+class _FakeResponse(object):
+    status_code = 200
+
+    def __init__(self, content):
+        self.content = content
+        self.headers = {"content-length": str(len(content))}
+
+    def iter_content(self, chunk_size=1024):
+        for i in range(0, len(self.content), chunk_size):
+            # slow down to make concurrent processes overlap
+            time.sleep(0.01)
+            yield self.content[i:i + chunk_size]
+
+
+@unittest.skipIf("fork" not in multiprocessing.get_all_start_methods(),
+                 "fork is required to share mocks with child processes")
+class TestDownloadLock(CpuCommonTest):
+    def setUp(self):
+        self.root_dir = tempfile.mkdtemp()
+        self.request_log = os.path.join(self.root_dir, "requests.log")
+        self.archive = _make_archive()
+
+    def tearDown(self):
+        shutil.rmtree(self.root_dir)
+
+    def fake_get(self, url, stream=True):
+        with open(self.request_log, "a") as f:
+            f.write(url + "\n")
+        return _FakeResponse(self.archive)
+
+    def _get_path(self, results):
+        results.put(
+            downloader.get_path_from_url(ARCHIVE_URL,
+                                         os.path.join(self.root_dir, "data")))
+
+    def test_download_once_in_two_processes(self):
+        ctx = multiprocessing.get_context("fork")
+        results = ctx.Queue()
+        with mock.patch.object(
+                downloader.requests, "get", side_effect=self.fake_get):
+            processes = [
+                ctx.Process(
+                    target=self._get_path, args=(results, )) for _ in range(2)
+            ]
+            for p in processes:
+                p.start()
+            paths = [results.get(timeout=60) for _ in processes]
+            for p in processes:
+                p.join()
+                self.assertEqual(p.exitcode, 0)
+        with open(self.request_log) as f:
+            self.assertEqual(f.read().splitlines(), [ARCHIVE_URL])
+        expected_path = os.path.join(self.root_dir, "data", "vocab")
+        self.assertEqual(paths, [expected_path, expected_path])
+        self.assertEqual(
+            sorted(os.listdir(expected_path)), ["merges.txt", "vocab.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()